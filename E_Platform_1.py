@@ -1,6 +1,11 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
+import hashlib
+import heapq
 import json
+import os
+import random
+import zlib
 
 # User Class
 class User(ABC):    
@@ -31,16 +36,19 @@ class Student(User):
         super().__init__(user_id, name, email, phone_number)
         self.student_id = student_id
         self._enrolled_courses = []
+        self.timetable = Timetable()  # Weekly sessions of the enrolled courses
 
     def enroll_in_course(self, course):
         if course not in self._enrolled_courses:
             self._enrolled_courses.append(course)
+            self.timetable.add_course(course)
         else:
             raise ValueError(f"Already enrolled in course: {course.title}")
 
     def drop_course(self, course):
         if course in self._enrolled_courses:
             self._enrolled_courses.remove(course)
+            self.timetable.remove_course(course)
         else:
             raise ValueError("Course not found in enrolled courses.")
 
@@ -58,16 +66,19 @@ class Instructor(User):
         super().__init__(user_id, name, email, phone_number)
         self.instructor_id = instructor_id
         self._assigned_courses = []
+        self.timetable = Timetable()  # Weekly sessions of the assigned courses
 
     def assign_course(self, course):
         if course not in self._assigned_courses:
             self._assigned_courses.append(course)
+            self.timetable.add_course(course)
         else:
             raise ValueError(f"Course {course.title} is already assigned.")
 
     def remove_assigned_course(self, course):
         if course in self._assigned_courses:
             self._assigned_courses.remove(course)
+            self.timetable.remove_course(course)
         else:
             raise ValueError("Course not found in assigned courses.")
 
@@ -134,6 +145,7 @@ class Course:
 
     def add_student(self, student):
         if student not in self.students_enrolled:
+            self.check_conflicts(student)
             self.students_enrolled.append(student)
             student.enroll_in_course(self)
         else:
@@ -153,9 +165,21 @@ class Course:
             raise ValueError(f"Assignment {assignment.title} already exists.")
 
     def set_instructor(self, instructor):
+        self.check_conflicts(instructor)
         self.instructor = instructor
         instructor.assign_course(self)
 
+    def session_intervals(self):
+        """Weekly (start, end) minutes of this course's sessions."""
+        return self.schedule.intervals() if isinstance(self.schedule, Schedule) else []
+
+    def check_conflicts(self, person):
+        """Raises ValueError if the course clashes with the person's timetable."""
+        conflicts = person.timetable.find_conflicts(self)
+        if conflicts:
+            titles = ", ".join(course.title for course in conflicts)
+            raise ValueError(f"Schedule conflict: {self.title} overlaps {titles} for {person.name}.")
+
     def get_course_details(self):
         return {
             "course_id": self.course_id,
@@ -169,20 +193,59 @@ class Course:
 
 from datetime import datetime
 
+class BlobStore:
+    """
+    Content-addressed, compressed store for submission bodies.
+    Each body is saved once under the SHA-256 of its text, so identical
+    submissions share one file and only the hash is kept in memory.
+    """
+    def __init__(self, root="submission_blobs"):
+        self.root = root  # Directory holding the blob files
+
+    def _path(self, digest):
+        return os.path.join(self.root, digest[:2], digest[2:])  # Fan out to keep directories small
+
+    def put(self, text):
+        data = text.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._path(digest)
+        if not os.path.exists(path):  # Already stored bodies are deduplicated
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, 'wb') as file:
+                file.write(zlib.compress(data))
+            os.replace(temp_path, path)  # Readers never see a partial blob
+        return digest
+
+    def get(self, digest):
+        path = self._path(digest)
+        if not os.path.exists(path):
+            raise ValueError(f"Submission body {digest} not found in blob store.")
+        with open(path, 'rb') as file:
+            data = zlib.decompress(file.read())
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ValueError(f"Submission body {digest} is corrupted.")
+        return data.decode("utf-8")
+
+    def contains(self, digest):
+        return os.path.exists(self._path(digest))
+
 class Assignment:
-    def __init__(self, assignment_id, title, description, due_date, max_score):
+    def __init__(self, assignment_id, title, description, due_date, max_score, blob_store=None):
         self.assignment_id = assignment_id  # Unique identifier for the assignment
         self.title = title  # Title of the assignment
         self.description = description  # Brief description of the assignment
         self.due_date = due_date  # Deadline for submission
         self.max_score = max_score  # Maximum score for the assignment
-        self.submissions = {}  # Stores submissions as {student_id: {"submission": str, "score": int, "date_submitted": datetime}}
+        self.blob_store = blob_store or BlobStore()  # Holds the submission bodies
+        self.submissions = {}  # Stores submissions as {student_id: {"submission_hash": str, "size": int, "score": int, "date_submitted": datetime}}
 
     def submit_assignment(self, student_id, submission_text):
         if student_id not in self.submissions:
             if datetime.now() <= self.due_date:
                 self.submissions[student_id] = {
-                    "submission": submission_text,
+                    "submission_hash": self.blob_store.put(submission_text),
+                    "size": len(submission_text),
                     "score": None,  # Score is assigned later by the instructor
                     "date_submitted": datetime.now(),
                 }
@@ -202,7 +265,9 @@ class Assignment:
 
     def get_submission(self, student_id):
         if student_id in self.submissions:
-            return self.submissions[student_id]
+            submission = dict(self.submissions[student_id])
+            submission["submission"] = self.blob_store.get(submission["submission_hash"])  # Body is loaded on demand
+            return submission
         else:
             raise ValueError(f"No submission found for student ID {student_id}.")
 
@@ -215,6 +280,8 @@ class Assignment:
                 f"Max Score: {self.max_score}, Submissions: {len(self.submissions)}")
 
 class Schedule:
+    DAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+
     def __init__(self, course_id, start_date, end_date, sessions):
         """
         :param course_id: The course ID the schedule is associated with.
@@ -226,10 +293,53 @@ class Schedule:
         self.start_date = start_date
         self.end_date = end_date
         self.sessions = sessions
+        self._indexed = set()  # (timetable, course) pairs holding this schedule's intervals
 
     def update_schedule(self, new_sessions):
-        """Update the session timings."""
+        """Update the session timings and every timetable that holds them."""
+        for session in new_sessions:
+            Schedule.parse_session(session)  # Reject the whole update before changing anything
         self.sessions = new_sessions
+        for timetable, course in list(self._indexed):
+            timetable.remove_course(course)
+            timetable.add_course(course)
+
+    @staticmethod
+    def parse_session(session):
+        """
+        Converts a session such as "Monday 10:00-12:00" into a half-open
+        (start, end) interval in minutes since Monday 00:00.
+        """
+        try:
+            day, times = session.split()
+            start_time, end_time = times.split("-")
+            day_index = [name[:3] for name in Schedule.DAYS].index(day.lower()[:3])
+            start = day_index * 24 * 60 + Schedule._minutes(start_time)
+            end = day_index * 24 * 60 + Schedule._minutes(end_time)
+        except ValueError:
+            raise ValueError(f"Invalid session '{session}'. Expected a format like 'Monday 10:00-12:00'.")
+        if end <= start:
+            raise ValueError(f"Invalid session '{session}'. The session must end after it starts.")
+        return start, end
+
+    @staticmethod
+    def _minutes(time_text):
+        hours, minutes = (int(part) for part in time_text.split(":"))
+        if not (0 <= hours <= 23 and 0 <= minutes < 60):
+            raise ValueError(f"Invalid time '{time_text}'.")
+        return hours * 60 + minutes
+
+    def intervals(self):
+        """Weekly intervals of all sessions."""
+        return [Schedule.parse_session(session) for session in self.sessions]
+
+    @staticmethod
+    def terms_overlap(schedule, other):
+        """Whether two schedules run during overlapping dates."""
+        try:
+            return schedule.start_date <= other.end_date and other.start_date <= schedule.end_date
+        except (AttributeError, TypeError):
+            return True  # Dates that cannot be compared are assumed to overlap
 
     def get_schedule_details(self):
         """Return schedule information."""
@@ -243,7 +353,165 @@ class Schedule:
     def __str__(self):
         return (f"Course ID: {self.course_id}, Start: {self.start_date}, "
                 f"End: {self.end_date}, Sessions: {', '.join(self.sessions)}")
-            
+
+class IntervalTree:
+    """
+    Interval tree over half-open [start, end) intervals, kept balanced as a
+    treap. Every node also stores the largest end in its subtree, so an
+    overlap query visits O(log n + k) nodes for k matches.
+    """
+    class _Node:
+        __slots__ = ("key", "start", "end", "item", "priority", "max_end", "left", "right")
+
+        def __init__(self, start, end, item):
+            self.key = (start, end, id(item))
+            self.start = start
+            self.end = end
+            self.item = item
+            self.priority = random.random()
+            self.max_end = end
+            self.left = None
+            self.right = None
+
+    def __init__(self):
+        self.root = None
+        self.size = 0
+
+    @staticmethod
+    def _update(node):
+        node.max_end = node.end
+        if node.left and node.left.max_end > node.max_end:
+            node.max_end = node.left.max_end
+        if node.right and node.right.max_end > node.max_end:
+            node.max_end = node.right.max_end
+
+    @staticmethod
+    def _split(node, key, inclusive=False):
+        """Splits a subtree into keys before key (or up to it, if inclusive) and the rest."""
+        if node is None:
+            return None, None
+        if node.key < key or (inclusive and node.key == key):
+            node.right, right = IntervalTree._split(node.right, key, inclusive)
+            IntervalTree._update(node)
+            return node, right
+        left, node.left = IntervalTree._split(node.left, key, inclusive)
+        IntervalTree._update(node)
+        return left, node
+
+    @staticmethod
+    def _merge(left, right):
+        if left is None or right is None:
+            return left or right
+        if left.priority > right.priority:
+            left.right = IntervalTree._merge(left.right, right)
+            IntervalTree._update(left)
+            return left
+        right.left = IntervalTree._merge(left, right.left)
+        IntervalTree._update(right)
+        return right
+
+    def insert(self, start, end, item):
+        node = IntervalTree._Node(start, end, item)
+        left, right = IntervalTree._split(self.root, node.key)
+        self.root = IntervalTree._merge(IntervalTree._merge(left, node), right)
+        self.size += 1
+
+    def remove(self, start, end, item):
+        key = (start, end, id(item))
+        left, rest = IntervalTree._split(self.root, key)
+        match, right = IntervalTree._split(rest, key, inclusive=True)
+        if match is None:
+            self.root = IntervalTree._merge(left, right)
+            raise ValueError(f"Interval {start}-{end} not found.")
+        match = IntervalTree._merge(match.left, match.right)  # Drop one copy, keep any duplicates
+        self.root = IntervalTree._merge(IntervalTree._merge(left, match), right)
+        self.size -= 1
+
+    def overlapping(self, start, end):
+        """Returns (start, end, item) for every stored interval overlapping [start, end)."""
+        found = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node is None or node.max_end <= start:
+                continue  # Nothing in this subtree ends after the query starts
+            stack.append(node.left)
+            if node.start < end:
+                if node.end > start:
+                    found.append((node.start, node.end, node.item))
+                stack.append(node.right)
+        return found
+
+    def __len__(self):
+        return self.size
+
+class Timetable:
+    """Weekly timetable of one student or instructor, indexed for conflict checks."""
+    def __init__(self):
+        self.tree = IntervalTree()
+        self.intervals = {}  # Course -> the intervals it was added with
+
+    def add_course(self, course):
+        intervals = course.session_intervals()
+        self.intervals[course] = intervals
+        for start, end in intervals:
+            self.tree.insert(start, end, course)
+        if isinstance(course.schedule, Schedule):
+            course.schedule._indexed.add((self, course))
+
+    def remove_course(self, course):
+        for start, end in self.intervals.pop(course, []):
+            self.tree.remove(start, end, course)
+        if isinstance(course.schedule, Schedule):
+            course.schedule._indexed.discard((self, course))
+
+    def find_conflicts(self, course):
+        """Returns the already scheduled courses whose sessions overlap the course's sessions."""
+        conflicts = []
+        for start, end in course.session_intervals():
+            for _, _, other in self.tree.overlapping(start, end):
+                if other is not course and other not in conflicts and Schedule.terms_overlap(course.schedule, other.schedule):
+                    conflicts.append(other)
+        return conflicts
+
+    @staticmethod
+    def validate_catalog(all_courses):
+        """
+        Checks every student's and instructor's timetable across the catalog.
+        Each person's sessions are sorted once and swept, so the pass costs
+        O(m log m + k) for m sessions and k conflicts instead of comparing
+        every pair of courses. Returns a list of (person, course, other_course),
+        where course has the session that starts first.
+        """
+        people = {}  # id(person) -> (person, [(start, end, course)])
+        for course in all_courses:
+            intervals = course.session_intervals()
+            if not intervals:
+                continue
+            members = list(course.students_enrolled)
+            if course.instructor:
+                members.append(course.instructor)
+            for person in members:
+                sessions = people.setdefault(id(person), (person, []))[1]
+                sessions.extend((start, end, course) for start, end in intervals)
+
+        conflicts = []
+        for person, sessions in people.values():
+            sessions.sort(key=lambda session: session[:2])
+            active = []  # Heap of (end, index) for sessions still running
+            seen = set()
+            for index, (start, end, course) in enumerate(sessions):
+                while active and active[0][0] <= start:
+                    heapq.heappop(active)
+                for _, other_index in active:
+                    other = sessions[other_index][2]
+                    pair = frozenset((id(course), id(other)))
+                    if other is not course and pair not in seen and Schedule.terms_overlap(course.schedule, other.schedule):
+                        seen.add(pair)
+                        conflicts.append((person, other, course))  # other started first
+                heapq.heappush(active, (end, index))
+        return conflicts
+
 class PlatformAdmin:
     def __init__(self, admin_id, name, email, phone_number):
         self.admin_id = admin_id
@@ -277,6 +545,15 @@ class PlatformAdmin:
         else:
             raise ValueError("Invalid user type.")
 
+    def validate_timetables(self, all_courses):
+        """Reports every schedule conflict across the catalog."""
+        conflicts = Timetable.validate_catalog(all_courses)
+        for person, course, other in conflicts:
+            print(f"Conflict for {person.name}: {course.title} overlaps {other.title}.")
+        if not conflicts:
+            print("No schedule conflicts found.")
+        return conflicts
+
     def delete_user(self, user, all_users):
         if user in all_users:
             all_users.remove(user)
@@ -332,8 +609,6 @@ class Login:
     def get_current_user(self):
         return self.current_user
     
-import os
-
 class JSONHandler:
     @staticmethod
     def save_to_file(data, filename):
@@ -542,7 +817,7 @@ class MenuSystem:
         course_id = input("Enter course ID to enroll: ")
         course = next((c for c in self.all_courses if c.course_id == course_id), None)
         if course:
-            try:
+            try:  # add_student rejects courses that clash with the student's timetable
                 course.add_student(student)
                 print(f"Enrolled in course '{course.title}' successfully!")
             except ValueError as e:
@@ -0,0 +1,62 @@
+"""
+File size, save time and load time of every store codec and level.
+
+Writes and reads a store's collections with plain JSON and with each
+codec at each level, and prints the total size and the best save and load
+times. By default the store is a synthetic one of the given size.
+
+    python benchmarks/bench_compression.py --students 20000 --courses 200
+    python benchmarks/bench_compression.py --store Case3_json
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from common import best_of, ep, synthetic_records
+
+
+def read_store(folder):
+    records = {}
+    for name in ep.REQUIRED_FIELDS:
+        with ep.StoreCompression.open_text(os.path.join(folder, name)) as file:
+            records[name] = json.load(file)
+    return records
+
+
+def measure(records, settings, repeats, work_folder):
+    """(bytes, best save seconds, best load seconds) of records written with settings."""
+    def save():
+        for name, collection in records.items():
+            ep.write_collection(work_folder, name, collection, compression=settings)
+
+    save_time = best_of(repeats, save)
+    load_time = best_of(repeats, lambda: read_store(work_folder))
+    size = sum(os.path.getsize(os.path.join(work_folder, name)) for name in records)
+    return size, save_time, load_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--store", help="read the collections from this store instead of generating them")
+    parser.add_argument("--students", type=int, default=20_000)
+    parser.add_argument("--courses", type=int, default=200)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+    records = read_store(args.store) if args.store else synthetic_records(args.students, args.courses)
+
+    candidates = [ep.StoreCompression.PLAIN] + [(codec, level) for codec in ep.StoreCompression.CODECS
+                                               for level in ep.StoreCompression.LEVELS[codec]]
+    with tempfile.TemporaryDirectory() as work_folder:
+        results = {settings: measure(records, settings, args.repeats, work_folder) for settings in candidates}
+
+    plain_size = results[ep.StoreCompression.PLAIN][0] or 1
+    print(f"{'Codec':<8}{'Level':>6}{'Bytes':>12}{'Ratio':>8}{'Save ms':>10}{'Load ms':>10}")
+    for (codec, level), (size, save, load) in results.items():
+        print(f"{codec or 'plain':<8}{'-' if level is None else level:>6}{size:>12,}{size / plain_size:>8.2f}"
+              f"{save * 1000:>10.2f}{load * 1000:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
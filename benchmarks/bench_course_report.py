@@ -0,0 +1,44 @@
+"""
+Course report timings on a synthetic store, end to end.
+
+Every timing includes pulling the values out of the Grade and Assignment
+objects, not just the NumPy summary: the all-course reports, and the
+single-course report the menus and the course-report command print.
+
+    python benchmarks/bench_course_report.py --students 200000 --courses 1000
+"""
+import argparse
+import tempfile
+
+from common import best_of, ep, quiet, write_synthetic_store
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--students", type=int, default=200_000, help="one course grade per student")
+    parser.add_argument("--courses", type=int, default=1_000)
+    parser.add_argument("--assignments", type=int, default=5, help="assignments per course")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+    if ep.np is None:
+        raise SystemExit("NumPy is required for course reports. Install it with 'pip install numpy'.")
+
+    with tempfile.TemporaryDirectory() as folder:
+        write_synthetic_store(folder, args.students, args.courses, args.assignments)
+        with ep.Platform("benchmark", folder).activate():
+            quiet(ep.load_all_data)
+            course = ep.CourseManager._courses[0]
+            scores = sum(len(assignment._graded_students) for assignment in ep.AssignmentManager._assignments)
+            print(f"{len(ep.GradeManager._grades):,} course grades and {scores:,} assignment scores "
+                  f"across {args.courses:,} courses")
+            rows = [
+                ("course_grade_report(), all courses", ep.CourseReportEngine.course_grade_report),
+                ("assignment_report(), all assignments", ep.CourseReportEngine.assignment_report),
+                ("print_course_report(one course)", lambda: quiet(ep.CourseReportEngine.print_course_report, course)),
+            ]
+            for label, function in rows:
+                print(f"{label:<40} {best_of(args.repeats, function) * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Serial vs parallel load of a synthetic store.
+
+Times load_all_data() with and without parallel=True, plus the parse step
+on its own: json.load in this process versus parse_collection in a worker
+pool, which also pays for pickling every record back to the parent.
+
+    python benchmarks/bench_parallel_load.py --students 100000 --courses 500
+"""
+import argparse
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from common import best_of, ep, quiet, write_synthetic_store
+
+
+def parse_serially(folder):
+    for filename in ep.REQUIRED_FIELDS:
+        with open(os.path.join(folder, filename)) as file:
+            json.load(file)
+
+
+def parse_in_pool(folder, workers):
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(ep.parse_collection, folder, filename) for filename in ep.REQUIRED_FIELDS]
+        for future in futures:
+            future.result()
+
+
+def load(folder, parallel, workers):
+    with ep.Platform("benchmark", folder).activate():
+        quiet(ep.load_all_data, parallel=parallel, max_workers=workers)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--students", type=int, default=100_000)
+    parser.add_argument("--courses", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: one per CPU)")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+    workers = args.workers or os.cpu_count() or 1
+
+    with tempfile.TemporaryDirectory() as folder:
+        write_synthetic_store(folder, args.students, args.courses)
+        size = sum(os.path.getsize(os.path.join(folder, name)) for name in ep.REQUIRED_FIELDS)
+        print(f"Store: {args.students} students, {args.courses} courses, {size / 1e6:.1f} MB; "
+              f"{workers} workers on {os.cpu_count()} CPUs")
+        rows = [
+            ("parse, this process", best_of(args.repeats, lambda: parse_serially(folder))),
+            ("parse, worker pool", best_of(args.repeats, lambda: parse_in_pool(folder, workers))),
+            ("load_all_data()", best_of(args.repeats, lambda: load(folder, False, workers))),
+            ("load_all_data(parallel=True)", best_of(args.repeats, lambda: load(folder, True, workers))),
+        ]
+    for label, seconds in rows:
+        print(f"{label:<30} {seconds:8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Leaderboard update and query cost by class size.
+
+A grade update re-inserts one student into the sorted key list, which
+shifts the list (O(n)); rank and top-k are binary searches and slices.
+Prints microseconds per update, per rank query and per top-10 listing for
+each class size, next to re-sorting the class once, which is what every
+request cost before the index.
+
+    python benchmarks/bench_rankings.py --sizes 100 1000 10000 100000
+"""
+import argparse
+import random
+import time
+from types import SimpleNamespace
+
+from common import ep
+
+
+def per_call(function, calls):
+    started = time.perf_counter()
+    for _ in range(calls):
+        function()
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+def measure(size, updates, seed):
+    rng = random.Random(seed)
+    students = [SimpleNamespace(_id=f"STU-{number:07d}") for number in range(size)]
+    board = ep.Leaderboard(higher_is_better=False)
+    grades = {}
+    for student in students:
+        grades[student._id] = round(rng.uniform(1.0, 5.0), 2)
+        board.set(student, grades[student._id])
+
+    def update():
+        student = rng.choice(students)
+        board.set(student, round(rng.uniform(1.0, 5.0), 2))
+
+    return {
+        "update": per_call(update, updates),
+        "rank": per_call(lambda: board.rank(rng.choice(students)), updates),
+        "top10": per_call(lambda: board.top(10), updates),
+        "sort": per_call(lambda: sorted(grades.items(), key=lambda item: item[1]), max(1, updates // 100)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 10_000, 100_000])
+    parser.add_argument("--updates", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'Students':>10}{'Update':>10}{'Rank':>10}{'Top 10':>10}{'Full sort':>12}  (microseconds)")
+    for size in args.sizes:
+        result = measure(size, args.updates, args.seed)
+        print(f"{size:>10,}{result['update']:>10.2f}{result['rank']:>10.2f}{result['top10']:>10.2f}{result['sort']:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+"""
+Record encode and decode times: generated codecs against the alternatives.
+
+Times every loaded record of a store with tracking suspended, per record:
+- the hand-written to_dict()/from_dict() methods the entity classes had
+  before RecordCodec, with the loaders' reference linking,
+- an interpreted walk of each class's SCHEMA,
+- the generated encode()/decode() and encode_row()/decode_row(),
+and compares the JSON and binary row sizes of each collection. By default
+the store is the sample store.
+
+    python benchmarks/bench_record_codecs.py
+    python benchmarks/bench_record_codecs.py --students 20000 --courses 200
+"""
+import argparse
+import json
+import os
+import shutil
+import tempfile
+
+from common import ROOT, best_of, ep, quiet, write_synthetic_store
+
+
+def legacy_encode(record):
+    """The dict the hand-written to_dict() methods built."""
+    if isinstance(record, ep.PlatformAdmin):
+        return {"id": record._id, "type": "Admin", "name": record._admin_name,
+                "email": record.email, "password": record.password}
+    if isinstance(record, ep.Person):
+        encoded = {
+            "id": record._id,
+            "first_name": record._first_name,
+            "last_name": record._last_name,
+            "age": record._age,
+            "sex": record._sex,
+            "birthdate": record._birthdate,
+            "place_of_birth": record._place_of_birth,
+            "email": record.email,
+            "password": record.password,
+        }
+        if isinstance(record, ep.Student):
+            encoded["type"] = "Student"
+            encoded["enrolled_courses"] = [course._course_id for course in record._enrolled_courses]
+        else:
+            encoded["type"] = "Instructor"
+            encoded["assigned_courses"] = [course._course_id for course in record._assigned_courses]
+        return encoded
+    if isinstance(record, ep.Course):
+        return {
+            "course_id": record._course_id,
+            "name": record._name,
+            "start_date": record._start_date,
+            "end_date": record._end_date,
+            "description": record._description,
+            "capacity": record._capacity,
+            "enrolled_students": [student._id for student in record._enrolled_students],
+            "instructor": record._instructor._id if record._instructor else None,
+            "applicants": [instructor._id for instructor in ep.ApplicationRegistry.applicants(record)],
+            "grading_policy": ep.GradingPolicyManager.policy_dict(record),
+        }
+    if isinstance(record, ep.Enrollment):
+        return {
+            "enrollment_id": record._enrollment_id,
+            "student_id": record._student._id if record._student else None,
+            "course_id": record._course._course_id if record._course else None,
+            "payment_status": record._payment_status,
+            "enrollment_status": record._enrollment_status,
+            "created_at": record._created_at,
+        }
+    if isinstance(record, ep.Assignment):
+        return {
+            "assignment_id": record._assignment_id,
+            "course_id": record._course._course_id if record._course else None,
+            "due_date": record._due_date,
+            "description": record._description,
+            "max_grade": record._max_grade,
+            "submitted_students": {student._id: status for student, status in record._submitted_students.items()},
+            "graded_students": {student._id: grade for student, grade in record._graded_students.items()},
+        }
+    return {
+        "grade_id": record._grade_id,
+        "student_id": record._student._id if record._student else None,
+        "course_id": record._course._course_id if record._course else None,
+        "grade_value": record._grade_value,
+    }
+
+
+def legacy_decode(cls, data, tables):
+    """
+    The hand-written from_dict() of cls, through the constructor, followed
+    by the loaders' separate linking of its references.
+    """
+    users, courses = tables["users"], tables["courses"]
+    if cls is ep.PlatformAdmin:
+        admin = ep.PlatformAdmin(data["id"], data["name"])
+        admin.email = data.get("email", "")
+        admin.password = data.get("password", "")
+        return admin
+    if cls in (ep.Student, ep.Instructor):
+        person = cls(data["first_name"], data["last_name"], data["age"], data["sex"],
+                     data["birthdate"], data["place_of_birth"])
+        person._id = data["id"]
+        person.email = data.get("email", "")
+        person.password = data.get("password", "")
+        if cls is ep.Student:
+            person._enrolled_courses = [courses[key] for key in data["enrolled_courses"] if key in courses]
+        else:
+            person._assigned_courses = [courses[key] for key in data["assigned_courses"] if key in courses]
+        return person
+    if cls is ep.Course:
+        course = ep.Course(data["course_id"], data["name"], data["start_date"], data["end_date"],
+                           data["description"], data["capacity"])
+        course._instructor = users.get(data["instructor"])
+        course._enrolled_students = [users[key] for key in data["enrolled_students"] if key in users]
+        return course
+    if cls is ep.Enrollment:
+        enrollment = ep.Enrollment(None, None, data["payment_status"], data["enrollment_status"])
+        enrollment._enrollment_id = data["enrollment_id"]
+        enrollment._created_at = data.get("created_at", 0.0)
+        enrollment._student = users.get(data["student_id"])
+        enrollment._course = courses.get(data["course_id"])
+        return enrollment
+    if cls is ep.Assignment:
+        assignment = ep.Assignment(data["assignment_id"], courses.get(data["course_id"]), data["due_date"],
+                                   data["description"], data.get("max_grade", 10.0))
+        assignment._submitted_students = {users[key]: status for key, status in data["submitted_students"].items()
+                                          if key in users}
+        assignment._graded_students = {users[key]: grade for key, grade in data["graded_students"].items()
+                                       if key in users}
+        return assignment
+    grade = ep.Grade(None, None, data["grade_value"])
+    grade._grade_id = data["grade_id"]
+    grade._student = users.get(data["student_id"])
+    grade._course = courses.get(data["course_id"])
+    return grade
+
+
+def encode_interpreted(codec, record):
+    """codec.encode() without code generation: walks the schema for every record."""
+    encoded = {}
+    for field in codec.schema:
+        if field.kind == "derived":
+            continue
+        value = getattr(record, field.attribute, None)
+        key = ep.RecordCodec.ID_ATTRIBUTES.get(field.target)
+        if field.kind == "ref":
+            value = getattr(value, key) if value is not None else None
+        elif field.kind == "refs":
+            value = [getattr(item, key) for item in value]
+        elif field.kind == "ref_map":
+            value = {getattr(item, key): entry for item, entry in value.items()}
+        elif field.kind == "constant":
+            value = field.value
+        elif field.kind == "computed":
+            value = field.function(record)
+        encoded[field.key] = value
+    return encoded
+
+
+def decode_interpreted(codec, data, tables):
+    """codec.decode() without code generation."""
+    record = object.__new__(codec.cls)
+    state = record.__dict__
+    for field in codec.schema:
+        if field.kind in ("constant", "computed", "derived"):
+            continue
+        if not field.load:
+            state[field.attribute] = field.initial() if field.initial else None
+            continue
+        value = data[field.key] if field.default is ep.Field.REQUIRED else data.get(field.key, field.default)
+        table = tables.get(field.target, {})
+        if field.kind == "ref":
+            value = table.get(value)
+        elif field.kind == "refs":
+            value = [table[key] for key in value if key in table]
+        elif field.kind == "ref_map":
+            value = {table[key]: entry for key, entry in value.items() if key in table}
+        state[field.attribute] = value
+    for field in codec.schema:
+        if field.kind == "derived":
+            state[field.attribute] = field.function(record)
+    return record
+
+
+def measure(records, tables, repeats, rounds):
+    """{measure: microseconds per record} for one collection, plus its JSON and row sizes in bytes."""
+    codecs = [ep.RecordCodec.of(type(record)) for record in records]
+    pairs = list(zip(codecs, records))
+    encoded = [codec.encode(record) for codec, record in pairs]
+    rows = [codec.encode_row(record) for codec, record in pairs]
+    assert [legacy_encode(record) for record in records] == encoded
+
+    def per_record(function):
+        return best_of(repeats, lambda: [function() for _ in range(rounds)]) / rounds / len(records) * 1e6
+
+    measures = {
+        "old_encode": per_record(lambda: [legacy_encode(record) for record in records]),
+        "walk_encode": per_record(lambda: [encode_interpreted(codec, record) for codec, record in pairs]),
+        "encode": per_record(lambda: [codec.encode(record) for codec, record in pairs]),
+        "row_encode": per_record(lambda: [codec.encode_row(record) for codec, record in pairs]),
+        "old_decode": per_record(lambda: [legacy_decode(codec.cls, data, tables) for codec, data in zip(codecs, encoded)]),
+        "walk_decode": per_record(lambda: [decode_interpreted(codec, data, tables) for codec, data in zip(codecs, encoded)]),
+        "decode": per_record(lambda: [codec.decode(data, tables) for codec, data in zip(codecs, encoded)]),
+        "row_decode": per_record(lambda: [codec.decode_row(row, tables) for codec, row in zip(codecs, rows)]),
+    }
+    measures["json_bytes"] = len(json.dumps(encoded))
+    measures["row_bytes"] = len(ep.RecordCodec.dump_rows(records))
+    return measures
+
+
+def report(repeats, rounds):
+    tables = ep.RecordCodec.id_tables()
+    print(f"{'Collection':<12}{'Records':>8}{'Old enc':>9}{'Walk enc':>10}{'Gen enc':>9}{'Row enc':>9}"
+          f"{'Old dec':>9}{'Walk dec':>10}{'Gen dec':>9}{'Row dec':>9}{'JSON B':>10}{'Rows B':>10}"
+          f"  (microseconds per record)")
+    for collection in ep.DirtyTracker.COLLECTIONS:
+        records = list(ep.collection_entities(collection))
+        if not records:
+            continue
+        with ep.DirtyTracker.suspended():
+            measures = quiet(measure, records, tables, repeats, rounds or max(1, 2_000 // len(records)))
+        print(f"{collection:<12}{len(records):>8}{measures['old_encode']:>9.2f}{measures['walk_encode']:>10.2f}"
+              f"{measures['encode']:>9.2f}{measures['row_encode']:>9.2f}{measures['old_decode']:>9.2f}"
+              f"{measures['walk_decode']:>10.2f}{measures['decode']:>9.2f}{measures['row_decode']:>9.2f}"
+              f"{measures['json_bytes']:>10}{measures['row_bytes']:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--store", default=os.path.join(ROOT, "Case3_json"), help="store folder to load (a copy is used)")
+    parser.add_argument("--students", type=int, help="load a synthetic store of this many students instead")
+    parser.add_argument("--courses", type=int, default=200, help="courses in the synthetic store")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--rounds", type=int, default=None, help="passes over a collection per timing (default: about 2,000 records)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        store = os.path.join(folder, "store")
+        if args.students:
+            os.mkdir(store)
+            write_synthetic_store(store, args.students, args.courses)
+        else:
+            shutil.copytree(args.store, store)  # Loading takes the store's lock file
+        with ep.Platform("benchmark", store).activate():
+            quiet(ep.load_all_data)
+            report(args.repeats, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Per-action latency of the menus, driven headlessly.
+
+Loads a copy of a store, then replays session scripts recorded with
+E_Platform_9.py --record FILE, or generates simulated sessions, through
+SessionDriver and prints p50/p90/p99/max latencies per menu action.
+Sessions run on the copy, so the store itself is never changed.
+
+    python benchmarks/bench_sessions.py --simulate 1000
+    python benchmarks/bench_sessions.py --replay session.json
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from common import ROOT, ep, quiet
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--replay", metavar="FILE", help="session scripts to replay")
+    source.add_argument("--simulate", type=int, default=1000, metavar="SESSIONS",
+                        help="number of simulated sessions to generate (default: 1000)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for --simulate")
+    parser.add_argument("--store", default=os.path.join(ROOT, "Case3_json"), help="store to copy (default: the sample store)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        store = shutil.copytree(args.store, os.path.join(folder, "store"))
+        with ep.Platform("sessions", store).activate():
+            quiet(ep.load_all_data)
+            if args.replay:
+                sessions = ep.SessionDriver.load_scripts(args.replay)
+            else:
+                sessions = ep.SessionDriver.generate_sessions(args.simulate, args.seed)
+            started = time.perf_counter()
+            latencies, failed = ep.SessionDriver.run(sessions)
+            ep.SessionDriver.report(latencies, failed, time.perf_counter() - started)
+
+
+if __name__ == "__main__":
+    main()
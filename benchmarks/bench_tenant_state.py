@@ -0,0 +1,49 @@
+"""
+Cost of reading Manager state through the active platform.
+
+Attributes named in a class's TENANT_STATE are resolved by the
+TenantScoped metaclass on every access: a context-variable lookup and a
+dict lookup on the platform, instead of a plain class attribute read.
+This times both kinds of read in a tight loop. For the effect on a whole
+workload, run bench_waitlist.py, whose events are dominated by such reads.
+
+    python benchmarks/bench_tenant_state.py --reads 1000000
+"""
+import argparse
+
+from common import best_of, ep
+
+
+class PlainState:
+    _waitlists = {}
+
+
+class TenantState(metaclass=ep.TenantScoped):
+    TENANT_STATE = ("_waitlists",)
+    _waitlists = {}
+
+
+def reader(cls, reads):
+    def read():
+        for _ in range(reads):
+            cls._waitlists
+    return read
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--reads", type=int, default=1_000_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    with ep.Platform("benchmark").activate():
+        TenantState._waitlists  # Creates the tenant's copy
+        plain = best_of(args.repeats, reader(PlainState, args.reads))
+        tenant = best_of(args.repeats, reader(TenantState, args.reads))
+    print(f"Plain class attribute: {plain / args.reads * 1e9:8.1f} ns/read")
+    print(f"TENANT_STATE attribute: {tenant / args.reads * 1e9:8.1f} ns/read "
+          f"(+{(tenant - plain) / args.reads * 1e9:.1f} ns)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Waitlist churn during a simulated registration week.
+
+Runs on a scratch platform in a temporary folder: approval requests that
+admit or waitlist, drops through CourseManager.drop_student (which marks the
+enrollment dropped and promotes the next student), and occasional capacity
+increases through CourseManager.update_capacity.
+
+    python benchmarks/bench_waitlist.py --events 200000
+"""
+import argparse
+import random
+import tempfile
+import time
+
+from common import ep, quiet
+
+
+def simulate(course_count, student_count, event_count, capacity, seed):
+    rng = random.Random(seed)
+    courses = [ep.CourseManager.create_course(f"Simulated {number}", "08/16/2024", "12/16/2024", "", capacity)
+               for number in range(course_count)]
+    students = []
+    for number in range(student_count):
+        student = ep.Student("Sim", str(number), 20, "Female", "01/01/2004", "Kidapawan City")
+        ep.UserManager.add_user(student)
+        students.append(student)
+
+    counts = {"requests": 0, "drops": 0, "capacity_increases": 0, "promotions": 0}
+    started = time.perf_counter()
+    for _ in range(event_count):
+        roll = rng.random()
+        course = rng.choice(courses)
+        seats_taken = len(course._enrolled_students)
+        if roll < 0.6:
+            student = rng.choice(students)
+            if course in student._enrolled_courses:
+                continue
+            enrollment = ep.Enrollment(student, course, rng.choice(("Paid", "Pending")))
+            ep.EnrollmentManager.add_enrollment(enrollment)
+            enrollment.approve()
+            counts["requests"] += 1
+        elif roll < 0.99:
+            if not seats_taken:
+                continue
+            student = course._enrolled_students[rng.randrange(seats_taken)]
+            ep.CourseManager.drop_student(course, student)
+            counts["promotions"] += len(course._enrolled_students) - (seats_taken - 1)
+            counts["drops"] += 1
+        else:
+            ep.CourseManager.update_capacity(course._course_id, course._capacity + 1)
+            counts["promotions"] += len(course._enrolled_students) - seats_taken
+            counts["capacity_increases"] += 1
+    counts["seconds"] = time.perf_counter() - started
+    counts["waitlisted"] = sum(len(entries) for entries in ep.WaitlistManager._waitlisted_by_student.values())
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--courses", type=int, default=200)
+    parser.add_argument("--students", type=int, default=20_000)
+    parser.add_argument("--events", type=int, default=200_000)
+    parser.add_argument("--capacity", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder, ep.Platform("simulation", folder).activate():
+        counts = quiet(simulate, args.courses, args.students, args.events, args.capacity, args.seed)
+    print(f"Simulated {args.events:,} registration events in {counts['seconds']:.3f}s "
+          f"({counts['seconds'] / args.events * 1e6:.1f}us/event): {counts['requests']:,} requests, "
+          f"{counts['drops']:,} drops, {counts['capacity_increases']:,} capacity increases, "
+          f"{counts['promotions']:,} promotions, {counts['waitlisted']:,} still waitlisted.")
+
+
+if __name__ == "__main__":
+    main()
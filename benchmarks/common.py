@@ -0,0 +1,85 @@
+"""
+Helpers shared by the benchmark scripts: importing the platform module,
+silencing its console output, timing, and writing synthetic stores.
+"""
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import E_Platform_9 as ep  # noqa: E402
+
+
+def quiet(function, *args, **kwargs):
+    """Calls function with its console output discarded."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return function(*args, **kwargs)
+
+
+def best_of(repeats, function):
+    """The best wall time of several runs of function(), in seconds."""
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def synthetic_records(students, courses, assignments_per_course=2, seed=0):
+    """
+    Plain records for a store of the given size, keyed by collection file.
+    Every student is enrolled in one course, graded there and has a
+    submission for each of that course's assignments.
+    """
+    rng = random.Random(seed)
+    course_ids = [f"CRS-{number:06d}" for number in range(courses)]
+    instructors = [{
+        "id": f"INS-00-{number:06d}", "type": "Instructor", "first_name": "Instructor", "last_name": str(number),
+        "age": 40, "sex": "Female", "birthdate": "01/01/1985", "place_of_birth": "Kabacan",
+        "email": f"instructor{number}@platform.com", "password": "secret", "assigned_courses": [course_id],
+    } for number, course_id in enumerate(course_ids)]
+    roster = {course_id: [] for course_id in course_ids}
+    users, enrollments, grades = list(instructors), [], []
+    for number in range(students):
+        student_id = f"STU-00-{number:06d}"
+        course_id = rng.choice(course_ids)
+        roster[course_id].append(student_id)
+        users.append({
+            "id": student_id, "type": "Student", "first_name": f"First{number}", "last_name": f"Last{number}",
+            "age": 20, "sex": "Male", "birthdate": "01/01/2004", "place_of_birth": "Kidapawan City",
+            "email": f"student{number}@platform.com", "password": "secret", "enrolled_courses": [course_id],
+        })
+        enrollments.append({"enrollment_id": f"ENR-{number:08d}", "student_id": student_id, "course_id": course_id,
+                            "payment_status": "Paid", "enrollment_status": "Approved"})
+        grades.append({"grade_id": f"GRD-{number:08d}", "student_id": student_id, "course_id": course_id,
+                       "grade_value": rng.choice([1.0, 1.5, 2.0, 2.5, 3.0, 5.0])})
+    course_records = [{
+        "course_id": course_id, "name": f"Course {number}", "start_date": "08/16/2024", "end_date": "12/16/2024",
+        "description": "Synthetic course", "capacity": len(roster[course_id]) + 10,
+        "enrolled_students": roster[course_id], "instructor": instructors[number]["id"],
+    } for number, course_id in enumerate(course_ids)]
+    assignments = [{
+        "assignment_id": f"ASS-{course_id}-{number}", "course_id": course_id, "due_date": "12/01/2024",
+        "description": "Synthetic assignment", "max_grade": 10.0,
+        "submitted_students": {student_id: "Submitted" for student_id in roster[course_id]},
+        "graded_students": {student_id: float(rng.randint(0, 10)) for student_id in roster[course_id]},
+    } for course_id in course_ids for number in range(assignments_per_course)]
+    return {"users.json": users, "courses.json": course_records, "enrollments.json": enrollments,
+            "assignments.json": assignments, "grades.json": grades}
+
+
+def write_synthetic_store(folder, students, courses, assignments_per_course=2, seed=0):
+    """Writes a synthetic store into folder and returns folder."""
+    os.makedirs(folder, exist_ok=True)
+    for filename, records in synthetic_records(students, courses, assignments_per_course, seed).items():
+        with open(os.path.join(folder, filename), "w") as file:
+            json.dump(records, file, indent=4)
+    return folder
@@ -0,0 +1,81 @@
+"""
+Multi-process stress test of the shared store.
+
+Several processes load one copy of the store, then each adds a grade and
+updates its own existing grade every round, saving after each change.
+Afterwards every added grade and every last update must be on disk.
+
+    python benchmarks/stress_store.py --processes 4 --rounds 25
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+from common import ROOT, ep, quiet
+
+
+def stress_worker(save_folder, worker, rounds):
+    """One process: load, then add and update grades, saving after each round."""
+    random.seed(worker)
+    with ep.Platform(f"stress-{worker}", save_folder).activate():
+        return quiet(_stress_rounds, worker, rounds)
+
+
+def _stress_rounds(worker, rounds):
+    ep.load_all_data()
+    students = [user for user in ep.UserManager._users if isinstance(user, ep.Student)]
+    courses = ep.CourseManager._courses
+    own = ep.GradeManager._grades[worker] if worker < len(ep.GradeManager._grades) else None
+    created, updated = [], {}
+    for round_number in range(rounds):
+        grade = ep.GradeManager.assign_grade(random.choice(students), random.choice(courses), 1.0 + round_number % 5)
+        created.append(grade._grade_id)
+        if own is not None:
+            own._grade_value = round(random.uniform(1.0, 5.0), 2)
+            updated[own._grade_id] = own._grade_value
+        ep.GradeManager.save_grades()
+    return created, updated
+
+
+def stress_test(seed_folder, processes, rounds):
+    """Runs the workers on a copy of seed_folder. Returns True when no write was lost."""
+    work_folder = tempfile.mkdtemp(prefix="store_stress_")
+    try:
+        for name in ep.REQUIRED_FIELDS:
+            if os.path.exists(os.path.join(seed_folder, name)):
+                shutil.copy(os.path.join(seed_folder, name), work_folder)
+        started = time.monotonic()
+        with multiprocessing.Pool(processes=processes) as pool:
+            results = pool.starmap(stress_worker, [(work_folder, worker, rounds) for worker in range(processes)])
+        elapsed = time.monotonic() - started
+
+        with ep.StoreCompression.open_text(os.path.join(work_folder, "grades.json")) as file:
+            saved_grades = {record["grade_id"]: record["grade_value"] for record in json.load(file)}
+        lost = sum(1 for created, _ in results for grade_id in created if grade_id not in saved_grades)
+        stale = sum(1 for _, updated in results for grade_id, value in updated.items()
+                    if saved_grades.get(grade_id) != value)
+    finally:
+        shutil.rmtree(work_folder, ignore_errors=True)
+
+    print(f"Stress test: {processes} processes made {processes * rounds} saves in {elapsed:.2f}s; "
+          f"{lost} added grades lost, {stale} updates lost.")
+    return lost == 0 and stale == 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--rounds", type=int, default=25)
+    parser.add_argument("--store", default=os.path.join(ROOT, "Case3_json"), help="store to copy (default: the sample store)")
+    args = parser.parse_args()
+    sys.exit(0 if stress_test(args.store, args.processes, args.rounds) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Shared fixtures. Every test works on its own copy of the sample store in
+Case3_json, behind its own Platform, so tests never touch the real files
+and never see each other's Manager state.
+"""
+import os
+import shutil
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import E_Platform_9 as ep  # noqa: E402
+
+SAMPLE_STORE = os.path.join(ROOT, "Case3_json")
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Path of a private copy of the sample store."""
+    folder = tmp_path / "Case3_json"
+    shutil.copytree(SAMPLE_STORE, folder)
+    return str(folder)
+
+
+@pytest.fixture
+def platform(store):
+    """A platform on the private store, active for the whole test. Nothing is loaded yet."""
+    platform = ep.Platform("test", store)
+    with platform.activate():
+        yield platform
+
+
+@pytest.fixture
+def loaded(platform):
+    """The test platform with the sample store loaded."""
+    ep.load_all_data()
+    platform.loaded = True
+    return platform
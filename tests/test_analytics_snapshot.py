@@ -0,0 +1,62 @@
+import pytest
+
+import E_Platform_9 as ep
+
+
+@pytest.fixture
+def snapshot(loaded, tmp_path):
+    path = ep.AnalyticsSnapshot.build(str(tmp_path / "analytics.snap"))
+    with ep.AnalyticsSnapshot(path) as snapshot:
+        yield snapshot
+
+
+def test_course_lookups_match_the_loaded_records(snapshot):
+    grades = {(grade._student._id, grade._course._course_id): grade._grade_value for grade in ep.GradeManager._grades}
+    assert snapshot.count("grades") == len(grades)
+    assert dict(snapshot.grades_for_course("CRS-859a31")) == \
+        {student: value for (student, course), value in grades.items() if course == "CRS-859a31"}
+    course = ep.CourseManager.get_course_by_id("CRS-859a31")
+    assert {student for student, _, _ in snapshot.enrollments_for_course("CRS-859a31")} == \
+        {student._id for student in course._enrolled_students}
+
+
+def test_student_lookups_match_the_loaded_records(snapshot):
+    student = ep.UserManager.find_user_by_id("STU-24-339058")
+    assignment = ep.AssignmentManager.get_assignment_by_id("ASS-001")
+    assert list(snapshot.scores_for_student(student._id)) == \
+        [("CRS-859a31", "ASS-001", assignment._graded_students[student], assignment._max_grade)]
+    assert dict(snapshot.grades_for_student(student._id)) == \
+        {grade._course._course_id: grade._grade_value for grade in ep.GradeManager._grades if grade._student is student}
+
+
+def test_waitlist_statuses_are_kept(loaded, tmp_path):
+    course = ep.CourseManager.get_course_by_id("CRS-859a31")
+    course._capacity = len(course._enrolled_students)
+    waiting = []
+    for number in range(3):
+        student = ep.Student("Waiting", str(number), 20, "Female", "01/01/2004", "Kidapawan City")
+        ep.UserManager.add_user(student)
+        enrollment = ep.Enrollment(student, course, "Paid")
+        ep.EnrollmentManager.add_enrollment(enrollment)
+        enrollment.approve()
+        waiting.append(student._id)
+    dropped = course._enrolled_students[0]._id
+    ep.CourseManager.drop_student(course, course._enrolled_students[0])  # Promotes the first in line
+    ep.WaitlistManager.cancel_student(ep.UserManager.find_user_by_id(waiting[2]))
+
+    with ep.AnalyticsSnapshot(ep.AnalyticsSnapshot.build(str(tmp_path / "analytics.snap"))) as snapshot:
+        statuses = {student: status for student, status, _ in snapshot.enrollments_for_course("CRS-859a31")}
+    assert [statuses[student] for student in (dropped, *waiting)] == ["Dropped", "Approved", "Waitlisted", "Cancelled"]
+    assert "Unknown" not in statuses.values()
+
+
+def test_unknown_ids_yield_nothing(snapshot):
+    assert list(snapshot.grades_for_student("STU-24-277413")) == []
+    assert list(snapshot.grades_for_course("CRS-missing")) == []
+
+
+def test_other_files_are_rejected(tmp_path):
+    path = tmp_path / "analytics.snap"
+    path.write_bytes(b"not a snapshot".ljust(64, b"\0"))
+    with pytest.raises(ValueError):
+        ep.AnalyticsSnapshot(str(path))
@@ -0,0 +1,55 @@
+import E_Platform_9 as ep
+
+BUSY, FREE = "INS-24-207112", "INS-24-240526"  # BUSY already teaches CRS-859a31
+
+
+def users_and_courses():
+    busy, free = ep.UserManager.find_user_by_id(BUSY), ep.UserManager.find_user_by_id(FREE)
+    return busy, free, ep.CourseManager.get_course_by_id("CRS-5ca834"), ep.CourseManager.get_course_by_id("CRS-4912d2")
+
+
+def test_applications_are_indexed_both_ways(loaded):
+    busy, free, first, second = users_and_courses()
+    assert ep.ApplicationRegistry.apply(free, first)
+    assert not ep.ApplicationRegistry.apply(free, first)
+    assert ep.ApplicationRegistry.apply(free, second) and ep.ApplicationRegistry.apply(busy, first)
+    assert ep.ApplicationRegistry.applicants(first) == [free, busy]
+    assert ep.ApplicationRegistry.applications_of(free) == [first, second]
+
+    assert ep.ApplicationRegistry.withdraw(free, first)
+    assert not ep.ApplicationRegistry.withdraw(free, first)
+    assert ep.ApplicationRegistry.applicants(first) == [busy]
+    ep.ApplicationRegistry.withdraw_all(free)
+    assert ep.ApplicationRegistry.applications_of(free) == []
+    assert ep.ApplicationRegistry._by_instructor == {BUSY: {"CRS-5ca834": first}}
+
+
+def test_applications_are_saved_with_their_course(loaded, store):
+    busy, free, first, _ = users_and_courses()
+    ep.ApplicationRegistry.apply(free, first)
+    ep.ApplicationRegistry.apply(busy, first)
+    assert ep.DirtyTracker.is_dirty("courses")
+    ep.save_all_data()
+    with ep.Platform("reloaded", store).activate():
+        ep.load_all_data()
+        course = ep.CourseManager.get_course_by_id("CRS-5ca834")
+        assert [instructor._id for instructor in ep.ApplicationRegistry.applicants(course)] == [FREE, BUSY]
+
+
+def test_best_applicants_spread_the_teaching_load(loaded):
+    busy, free, first, second = users_and_courses()
+    for course in (first, second):
+        ep.ApplicationRegistry.apply(busy, course)
+        ep.ApplicationRegistry.apply(free, course)
+    assigned = ep.ApplicationRegistry.assign_best_applicants()
+    assert assigned == [(first, free), (second, busy)]  # Ties go to the oldest application
+    assert ep.ApplicationRegistry.applicants(first) == [busy]  # Other applications stay on file
+    assert ep.ApplicationRegistry.applicants(second) == [free]
+
+
+def test_removing_a_course_forgets_its_applications(loaded):
+    _, free, first, second = users_and_courses()
+    ep.ApplicationRegistry.apply(free, first)
+    ep.ApplicationRegistry.apply(free, second)
+    ep.CourseManager.remove_course("CRS-5ca834")
+    assert ep.ApplicationRegistry.applications_of(free) == [second]
@@ -0,0 +1,41 @@
+import json
+import os
+
+import E_Platform_9 as ep
+
+STUDENT = "STU-24-339058"
+
+
+def saved_first_name(store):
+    with open(os.path.join(store, "users.json")) as file:
+        return {record["id"]: record for record in json.load(file)}[STUDENT]["first_name"]
+
+
+def rename(first_name):
+    ep.UserManager.find_user_by_id(STUDENT)._first_name = first_name
+
+
+def test_flush_writes_pending_changes(loaded, store):
+    autosaver = ep.Autosaver(max_delay=60).start()
+    try:
+        rename("Autosaved")
+        assert autosaver.flush(timeout=10)
+        assert saved_first_name(store) == "Autosaved"
+    finally:
+        autosaver.stop()
+
+
+def test_failed_flush_is_reported_and_retried(loaded, store, monkeypatch):
+    autosaver = ep.Autosaver(max_delay=60)
+    ep.DirtyTracker._autosaver = autosaver  # Noted, but flushed only when asked
+    rename("Retried")
+    with monkeypatch.context() as patch:
+        patch.setattr(ep.DirtyTracker, "write", staticmethod(lambda collection, entities, filename=None: None))
+        assert not autosaver.flush()
+    assert autosaver._written == 0
+    assert ("users", STUDENT) in autosaver._pending
+    assert saved_first_name(store) != "Retried"
+
+    assert autosaver.flush()
+    assert saved_first_name(store) == "Retried"
+    assert autosaver._pending == {}
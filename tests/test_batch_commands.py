@@ -0,0 +1,47 @@
+import os
+
+import E_Platform_9 as ep
+
+
+def run(*argv):
+    return ep.BatchCommands.run(ep.parse_args(list(argv)))
+
+
+def file_contents(store):
+    contents = {}
+    for name in sorted(os.listdir(store)):
+        if name.endswith(".json"):
+            with open(os.path.join(store, name), "rb") as file:
+                contents[name] = file.read()
+    return contents
+
+
+def test_commands_load_what_they_link_against():
+    assert ep.BatchCommands.collections_for("grade-import") == ["users", "courses", "grades"]
+    assert ep.BatchCommands.collections_for("assign-instructors") == ["users", "courses", "enrollments"]
+    assert ep.BatchCommands.collections_for("remove-user") == list(ep.DirtyTracker.COLLECTIONS)
+
+
+def test_grade_import_saves_only_grades(platform, store, tmp_path):
+    before = file_contents(store)
+    csv_file = tmp_path / "grades.csv"
+    csv_file.write_text("student_id,course_id,grade\nSTU-24-339058,CRS-859a31,2.0\nSTU-24-277413,CRS-859a31,2.0\n"
+                        "STU-missing,CRS-859a31,2.0\n")
+    assert run("grade-import", str(csv_file)) == 1  # The two rows that cannot be imported are reported
+    assert ep.UserManager._users and not ep.EnrollmentManager._enrollments  # Enrollments were never loaded
+    after = file_contents(store)
+    assert {name for name in before if after[name] != before[name]} <= {"grades.json"}
+
+
+def test_remove_user_cascades_and_saves(platform, store):
+    assert run("remove-user", "STU-24-339058") == 0
+    with ep.Platform("reader", store).activate():
+        ep.load_all_data()
+        assert ep.UserManager.find_user_by_id("STU-24-339058") is None
+        assert all(enrollment._student._id != "STU-24-339058" for enrollment in ep.EnrollmentManager._enrollments)
+        assert ep.ReferenceIndex.check() == []
+
+
+def test_unknown_users_and_courses_fail(platform):
+    assert run("remove-user", "STU-missing") == 1
+    assert run("course-report", "CRS-missing") == 1
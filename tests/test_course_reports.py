@@ -0,0 +1,22 @@
+import pytest
+
+import E_Platform_9 as ep
+
+pytest.importorskip("numpy")
+
+
+def test_course_grade_report_for_one_course_matches_the_full_report(loaded):
+    course = ep.CourseManager.get_course_by_id("CRS-859a31")
+    full = ep.CourseReportEngine.course_grade_report()
+    single = ep.CourseReportEngine.course_grade_report(courses=[course])
+    assert list(single) == ["CRS-859a31"]
+    assert single["CRS-859a31"] == full["CRS-859a31"]
+    assert single["CRS-859a31"]["count"] == 16
+
+
+def test_print_course_report_lists_only_that_course(loaded, capsys):
+    ep.CourseReportEngine.print_course_report(ep.CourseManager.get_course_by_id("CRS-859a31"))
+    output = capsys.readouterr().out
+    assert "Graded Students: 16" in output
+    assert "Assignment ID: ASS-001 | Graded: 16/16" in output
+    assert "Assignment ID: ASS-002 | Graded: 0/0" in output
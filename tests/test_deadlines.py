@@ -0,0 +1,48 @@
+import random
+import threading
+import time
+
+import E_Platform_9 as ep
+
+
+def test_scheduler_fires_each_deadline_once_in_order(loaded):
+    scheduler = ep.DeadlineScheduler(start_time=0)
+    closed = []
+    scheduler.subscribe(closed.append)
+    scheduler.run_pending()
+    assert [assignment._assignment_id for assignment in closed] == ["ASS-001", "ASS-002"]
+    assert scheduler.run_pending() == []
+    assert scheduler.next_deadline() is None
+
+
+def test_scheduler_reads_while_assignments_are_added(loaded):
+    course = ep.CourseManager.get_course_by_id("CRS-859a31")
+    stop = threading.Event()
+    errors = []
+
+    def read():
+        try:
+            while not stop.is_set():
+                deadlines = [assignment._deadline for assignment in ep.DeadlineIndex.closed_between(0, time.time())]
+                assert deadlines == sorted(deadlines)
+        except Exception as e:
+            errors.append(e)
+
+    reader = threading.Thread(target=ep.contextvars.copy_context().run, args=(read,))
+    reader.start()
+    rng = random.Random(0)
+    for number in range(2000):
+        due = f"{rng.randint(1, 12):02d}/{rng.randint(1, 28):02d}/{rng.randint(2020, 2024)}"
+        ep.AssignmentManager.add_assignment(course._course_id, f"ASS-{number}", due, "Generated", 10.0)
+    stop.set()
+    reader.join()
+    assert errors == []
+    assert len(ep.DeadlineIndex.closed_between(0, time.time())) == 2002
+
+
+def test_main_runs_the_scheduler_for_the_session(platform, monkeypatch):
+    started, stopped = [], []
+    monkeypatch.setattr(ep.DeadlineScheduler, "start", lambda self, max_sleep=60.0: started.append(self))
+    monkeypatch.setattr(ep.DeadlineScheduler, "stop", lambda self: stopped.append(self))
+    ep.main(console=ep.ScriptedTransport(["3"], {}))
+    assert len(started) == 1 and stopped == started
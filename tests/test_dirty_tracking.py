@@ -0,0 +1,34 @@
+import json
+import os
+
+import E_Platform_9 as ep
+
+
+def read_courses(store):
+    with open(os.path.join(store, "courses.json")) as file:
+        return {record["course_id"]: record for record in json.load(file)}
+
+
+def test_records_repaired_on_load_are_written_back(platform, store):
+    path = os.path.join(store, "courses.json")
+    courses = read_courses(store)
+    courses["CRS-859a31"]["enrolled_students"].append("STU-GHOST")  # A student deleted by another tool
+    with open(path, "w") as file:
+        json.dump(list(courses.values()), file, indent=4)
+
+    ep.load_all_data()
+    assert ep.DirtyTracker.is_dirty("courses")
+    other = ep.CourseManager.get_course_by_id("CRS-5ca834")
+    ep.DirtyTracker.mark(other)  # An unrelated change in the same collection
+    other._capacity += 1
+    ep.save_all_data()
+
+    saved = read_courses(store)
+    assert "STU-GHOST" not in saved["CRS-859a31"]["enrolled_students"]
+    assert saved["CRS-5ca834"]["capacity"] == courses["CRS-5ca834"]["capacity"] + 1
+
+
+def test_unchanged_records_keep_their_source_text(loaded):
+    student = ep.UserManager.find_user_by_id("STU-24-339058")
+    assert student._fragment is not None
+    assert not ep.DirtyTracker.is_dirty("users")
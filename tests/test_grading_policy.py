@@ -0,0 +1,61 @@
+import pytest
+
+import E_Platform_9 as ep
+
+STUDENT = "STU-24-339058"  # Graded 10/10 on ASS-001; ASS-002 is not graded yet
+
+
+@pytest.fixture
+def course(loaded):
+    return ep.CourseManager.get_course_by_id("CRS-859a31")
+
+
+def grade_half_marks(student):
+    assignment = ep.AssignmentManager.get_assignment_by_id("ASS-002")
+    ep.DirtyTracker.mark(assignment)
+    assignment._submitted_students[student] = "Submitted"  # Submitted before the deadline passed
+    assignment.grade(student, assignment._max_grade / 2)
+
+
+def test_scores_below_every_band_fail():
+    policy = ep.GradingPolicy(scale=[(50.0, 3.0), (90.0, 1.0)])
+    assert policy.grade_for(30.0) == 5.0
+    assert policy.grade_for(50.0) == 3.0
+    assert policy.grade_for(95.0) == 1.0
+
+
+def test_ungraded_work_does_not_count_against_students(course):
+    student = ep.UserManager.find_user_by_id(STUDENT)
+    assert ep.GradingPolicyManager.percentage(course, student) == pytest.approx(100.0)
+    grade_half_marks(student)
+    assert ep.GradingPolicyManager.percentage(course, student) == pytest.approx(75.0)
+    assert ep.GradingPolicyManager.final_grade(course, student) == 2.0
+
+
+def test_weights_apply_to_graded_work_only(course):
+    student = ep.UserManager.find_user_by_id(STUDENT)
+    grade_half_marks(student)
+    ep.GradingPolicyManager.set_policy(course, {"ASS-001": 3.0, "ASS-002": 1.0})
+    assert ep.GradingPolicyManager.percentage(course, student) == pytest.approx(87.5)
+    other = ep.UserManager.find_user_by_id("STU-24-181694")
+    assert ep.GradingPolicyManager.percentage(course, other) == pytest.approx(100.0)
+
+
+def test_final_grades_show_the_changes_before_publishing(course):
+    student = ep.UserManager.find_user_by_id(STUDENT)
+    grade_half_marks(student)
+    assert [(change[0], change[2]) for change in ep.GradingPolicyManager.changes(course)] == [(student, 2.0)]
+
+    console = ep.ScriptedTransport(["y"], {}, capture=True)
+    ep.GradingPolicyManager.view_final_grades(course, console=console)
+    output = "".join(console.output)
+    assert f"Student ID: {STUDENT}" in output and "Grade: 1.0 -> 2.0" in output
+    assert ep.TranscriptManager.current_grade(student, course)._grade_value == 2.0
+    assert ep.GradingPolicyManager.changes(course) == []
+
+
+def test_removed_students_leave_no_sums(course):
+    student = ep.UserManager.find_user_by_id(STUDENT)
+    ep.UserManager.remove_student(STUDENT)
+    assert all(student not in sums for sums in ep.GradingPolicyManager._points.values())
+    assert all(student not in sums for sums in ep.GradingPolicyManager._graded_weight.values())
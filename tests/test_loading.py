@@ -0,0 +1,31 @@
+import E_Platform_9 as ep
+
+
+def state_of_store():
+    """The loaded collections as plain records, for comparing two loads."""
+    return {collection: [entity.to_dict() for entity in ep.collection_entities(collection)]
+            for collection in ep.DirtyTracker.COLLECTIONS}
+
+
+def test_parallel_load_matches_serial_load(store):
+    with ep.Platform("serial", store).activate():
+        ep.load_all_data()
+        serial = state_of_store()
+    with ep.Platform("parallel", store).activate():
+        ep.load_all_data(parallel=True, max_workers=2)
+        parallel = state_of_store()
+    assert parallel == serial
+    assert len(serial["users"]) == 20
+
+
+def test_lookups_use_the_id_indexes(loaded):
+    student = ep.UserManager.find_user_by_id("STU-24-339058")
+    assert student._first_name == "Angel"
+    assert ep.CourseManager.get_course_by_id("CRS-859a31")._name == "Math 01"
+    assert ep.UserManager.find_user_by_id("STU-MISSING") is None
+    assert ep.CourseManager.get_course_by_id("CRS-MISSING") is None
+
+
+def test_removed_user_is_no_longer_found(loaded):
+    ep.UserManager.remove_student("STU-24-339058")
+    assert ep.UserManager.find_user_by_id("STU-24-339058") is None
@@ -0,0 +1,82 @@
+from types import SimpleNamespace
+
+import E_Platform_9 as ep
+
+
+def rows(count):
+    return [SimpleNamespace(id=f"ROW-{number:03d}", score=number % 7) for number in range(count)]
+
+
+def query(source):
+    return ep.Query(source, lambda row: row.id)
+
+
+def read_all(query, size):
+    pages, cursor = [], None
+    while True:
+        page, cursor = query.page(size, cursor)
+        pages.append(page)
+        if cursor is None:
+            return pages
+
+
+def test_unordered_pages_follow_collection_order():
+    source = rows(25)
+    pages = read_all(query(source).where(lambda row: row.score != 0), 10)
+    assert [len(page) for page in pages] == [10, 10, 1]
+    assert [row for page in pages for row in page] == [row for row in source if row.score != 0]
+
+
+def test_ordered_pages_break_ties_by_id():
+    source = rows(40)
+    for reverse in (False, True):
+        pages = read_all(query(source).order_by(lambda row: row.score, reverse=reverse), 6)
+        expected = sorted(source, key=lambda row: (row.score, row.id), reverse=reverse)
+        assert [row for page in pages for row in page] == expected
+
+
+def test_a_full_last_page_ends_the_query():
+    pages = list(query(rows(20)).pages(10))
+    assert [len(page) for page in pages] == [10, 10]
+
+
+def test_sources_are_read_when_paging():
+    source = rows(3)
+    listing = query(lambda: source)
+    source.append(SimpleNamespace(id="ROW-late", score=0))
+    assert listing.count() == 4
+
+
+class PagingConsole(ep.ConsoleTransport):
+    def __init__(self, answers):
+        self.answers = iter(answers)
+        self.writes = []
+
+    def write(self, text, flush=False):
+        self.writes.append(text)
+
+    def read(self, prompt):
+        return next(self.answers)
+
+
+def test_render_pages_stops_when_asked():
+    console = PagingConsole(["", "q"])
+    shown = ep.render_pages(query(rows(50)), lambda row: row.id, title="Rows", page_size=10, console=console)
+    assert shown == 20
+    assert "--- Rows ---" in console.writes[0] and "ROW-019" in console.writes[1]
+
+
+def test_render_pages_reports_empty_results():
+    console = PagingConsole([])
+    assert ep.render_pages(query([]), str, empty_message="Nothing here.", console=console) == 0
+    assert "Nothing here." in "".join(console.writes)
+
+
+def test_view_all_users_pages_the_sample_store(loaded):
+    console = PagingConsole([""] * 10)
+    ep.UserManager.view_all_users(user_type="Student", order_by_name=True, page_size=5, console=console)
+    listed = [line for text in console.writes for line in text.splitlines() if line.startswith("ID: ")]
+    students = [user for user in ep.UserManager._users if isinstance(user, ep.Student)]
+    assert len(listed) == len(students)
+    names = [line.split("Name: ")[1].split(", Type")[0].lower() for line in listed]
+    assert names == sorted(names)
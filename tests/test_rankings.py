@@ -0,0 +1,64 @@
+from types import SimpleNamespace
+
+import E_Platform_9 as ep
+
+
+def students(*ids):
+    return [SimpleNamespace(_id=student_id) for student_id in ids]
+
+
+def test_tied_students_share_the_best_rank():
+    a, b, c, d = students("A", "B", "C", "D")
+    board = ep.Leaderboard(higher_is_better=True)
+    for student, score in ((a, 7), (b, 9), (c, 7), (d, 3)):
+        board.set(student, score)
+    assert [board.rank(student) for student in (a, b, c, d)] == [2, 1, 2, 4]
+    assert board.percentile(a) == 75.0 and board.percentile(d) == 25.0
+    assert board.top(2) == [(b, 9), (a, 7)]
+
+
+def test_updates_and_removals_rerank():
+    a, b = students("A", "B")
+    board = ep.Leaderboard(higher_is_better=False)  # Course grades: 1.0 is best
+    board.set(a, 2.0)
+    board.set(b, 1.5)
+    board.set(a, 1.0)
+    assert board.top(2) == [(a, 1.0), (b, 1.5)] and len(board) == 2
+    board.discard(a)
+    assert board.rank(a) is None and board.rank(b) == 1
+
+
+def test_loaded_rankings_follow_current_grades(loaded):
+    course = ep.CourseManager.get_course_by_id("CRS-859a31")
+    board = ep.RankingIndex.course(course)
+    grades = {grade._student._id: grade._grade_value for grade in ep.GradeManager._grades}
+    assert len(board) == len(grades)
+    assert [value for _, value in board.top(len(board))] == sorted(grades.values())
+
+    student = ep.UserManager.find_user_by_id("STU-24-339058")
+    grade = next(grade for grade in ep.GradeManager._grades if grade._student is student)
+    ep.GradeManager.update_grade(grade, 5.0)
+    assert board.rank(student) == len(board) - sum(1 for value in grades.values() if value == 5.0)
+    ep.UserManager.remove_student(student._id)
+    assert board.rank(student) is None and len(board) == len(grades) - 1
+
+
+def test_assignment_scores_are_ranked_as_graded(loaded):
+    assignment = ep.AssignmentManager.get_assignment_by_id("ASS-001")
+    board = ep.RankingIndex.assignment(assignment)
+    student = next(iter(assignment._submitted_students))
+    assignment.grade(student, assignment._max_grade)
+    assert board.rank(student) == 1
+    assert board.top(1)[0][1] == assignment._max_grade
+
+
+def test_reading_rankings_creates_no_boards(loaded):
+    student = ep.UserManager.find_user_by_id("STU-24-277413")
+    empty = ep.CourseManager.get_course_by_id("CRS-5ca834")
+    ep.TranscriptManager.on_enrolled(student, empty)
+    before = (set(ep.RankingIndex._courses), set(ep.RankingIndex._assignments))
+    ep.TranscriptManager.view_transcript(student)
+    ep.RankingIndex.view_leaderboard(empty)
+    ep.RankingIndex.on_course_grade(student, empty)
+    assert (set(ep.RankingIndex._courses), set(ep.RankingIndex._assignments)) == before
+    assert ep.RankingIndex.find_course(empty) is None
@@ -0,0 +1,40 @@
+import json
+import os
+
+import E_Platform_9 as ep
+from conftest import SAMPLE_STORE
+
+
+def test_sample_records_encode_as_stored(loaded):
+    for collection in ("users", "assignments", "grades"):  # The loader repairs some courses and enrollments
+        with open(os.path.join(SAMPLE_STORE, f"{collection}.json")) as file:
+            stored = json.load(file)
+        assert [entity.to_dict() for entity in ep.collection_entities(collection)] == stored
+
+
+def test_decoded_records_encode_the_same(loaded):
+    tables = ep.RecordCodec.id_tables()
+    for collection in ep.DirtyTracker.COLLECTIONS:
+        for entity in ep.collection_entities(collection):
+            codec = ep.RecordCodec.of(type(entity))
+            with ep.DirtyTracker.suspended():
+                copy = codec.decode(codec.encode(entity), tables)
+                row_copy = codec.decode_row(codec.encode_row(entity), tables)
+            assert type(copy) is type(entity)
+            for field in codec.schema:
+                if field.load:  # The rest is linked or registered by the loaders
+                    expected = getattr(entity, field.attribute)
+                    assert getattr(copy, field.attribute) == getattr(row_copy, field.attribute) == expected
+
+
+def test_binary_rows_rebuild_every_record(loaded):
+    records = list(ep.collection_entities("grades"))
+    with ep.DirtyTracker.suspended():
+        rebuilt = ep.RecordCodec.load_rows(ep.RecordCodec.dump_rows(records))
+    assert [record.to_dict() for record in rebuilt] == [record.to_dict() for record in records]
+
+
+def test_compiling_a_codec_leaves_the_class_alone(loaded):
+    ep.RecordCodec.of(ep.Student)
+    assert "to_dict" not in vars(ep.Student)
+    assert ep.Student.to_dict is ep.TrackedRecord.to_dict
@@ -0,0 +1,51 @@
+import E_Platform_9 as ep
+
+STUDENT = "STU-24-339058"
+COURSE = "CRS-859a31"
+
+
+def scan(student_id=None, course_id=None):
+    """Every remaining object that still points at the student or course, found the slow way."""
+    found = []
+    for holder in ep.ReferenceIndex.all_holders():
+        keys = ep.ReferenceIndex.edges_of(holder)
+        if student_id in keys or course_id in keys:
+            found.append(holder)
+    return found
+
+
+def test_removing_a_student_cascades(loaded):
+    student = ep.UserManager.find_user_by_id(STUDENT)
+    course = ep.CourseManager.get_course_by_id(COURSE)
+    ep.UserManager.remove_student(STUDENT)
+    assert scan(student_id=STUDENT) == []
+    assert student not in course._enrolled_students
+    assert all(grade._student is not student for grade in ep.GradeManager._grades)
+    assert ep.ReferenceIndex.holders(STUDENT) == set()
+    assert ep.ReferenceIndex.check() == []
+
+
+def test_removing_a_course_cascades(loaded):
+    ep.CourseManager.remove_course(COURSE)
+    assert scan(course_id=COURSE) == []
+    assert ep.EnrollmentManager._enrollments == [] and ep.GradeManager._grades == []
+    assert all(assignment._course is None or assignment._course._course_id != COURSE
+               for assignment in ep.AssignmentManager._assignments)
+    assert ep.ReferenceIndex.check() == []
+
+
+def test_removing_an_instructor_unassigns_their_courses(loaded):
+    course = ep.CourseManager.get_course_by_id(COURSE)
+    instructor = course._instructor
+    ep.UserManager.remove_instructor(instructor._id)
+    assert course._instructor is None
+    assert ep.ReferenceIndex.holders(instructor._id) == set()
+    assert ep.ReferenceIndex.check() == []
+
+
+def test_check_reports_stale_references(loaded):
+    grade = ep.GradeManager._grades[0]
+    grade._student = ep.Student("Stray", "Student", 20, "Female", "01/01/2004", "Kidapawan City")
+    problems = ep.ReferenceIndex.check()
+    assert any("references missing" in problem for problem in problems)
+    assert any("Index out of date" in problem for problem in problems)
@@ -0,0 +1,40 @@
+from types import SimpleNamespace
+
+import E_Platform_9 as ep
+
+
+def course_index(names):
+    index = ep.SearchIndex({"name": 3, "description": 1})
+    for number, name in enumerate(names):
+        index.add(number, SimpleNamespace(name=name, description=""))
+    return index
+
+
+def test_short_prefix_matches_every_document():
+    index = course_index([f"section{number:03d}" for number in range(300)] + ["statistics"])
+    assert len(index.search("s", limit=1000)) == 301
+    assert index.search("stat") == [300]
+
+
+def test_every_term_is_a_prefix_and_all_must_match():
+    index = course_index(["Introduction to Programming", "Intro Physics", "Programming Languages"])
+    assert index.search("intro prog") == [0]
+    assert index.search("prog") == [0, 2]
+    assert index.search("intro chem") == []
+
+
+def test_whole_word_matches_rank_first():
+    index = course_index(["Introduction", "Intro"])
+    assert index.search("intro") == [1, 0]
+
+
+def test_removed_documents_are_not_found():
+    index = course_index(["Algebra", "Algorithms"])
+    index.remove(0)
+    assert index.search("alg") == [1]
+    assert index.expand("alge") == []
+
+
+def test_user_search_on_the_sample_store(loaded):
+    found = ep.UserManager.search_users("angel ang")
+    assert [user._id for user in found] == ["STU-24-339058"]
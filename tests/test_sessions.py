@@ -0,0 +1,37 @@
+import E_Platform_9 as ep
+
+
+def test_module_uses_the_builtin_console_functions():
+    assert "print" not in vars(ep) and "input" not in vars(ep)
+
+
+def test_scripted_session_goes_through_its_console(loaded, capsys):
+    console = ep.ScriptedTransport(["9", "3"], {}, capture=True)
+    ep.general_menu(console=console)
+    output = "".join(console.output)
+    assert "--- General Menu ---" in output
+    assert "Invalid choice. Please try again." in output
+    assert "Exiting program. Goodbye!" in output
+    assert "General Menu" not in capsys.readouterr().out
+
+
+def test_menu_actions_write_to_the_session_console(loaded, capsys):
+    student = ep.UserManager.find_user_by_id("STU-24-339058")
+    instructor = ep.UserManager.find_user_by_id("INS-24-207112")
+    console = ep.ScriptedTransport(["1", student.email, student.password, "1", "5", "11",
+                                    "1", instructor.email, instructor.password, "5", "CRS-859a31", "14", "CRS-859a31",
+                                    "15", "3"], {}, capture=True)
+    ep.general_menu(console=console)
+    output = "".join(console.output)
+    assert "Login successful!" in output and "Student Profile:" in output
+    assert f"--- Transcript: {student._first_name}" in output
+    assert "--- Students in Course:" in output and "--- Leaderboard:" in output
+    assert capsys.readouterr().out == ""
+
+
+def test_generated_sessions_replay_without_failures(loaded, capsys):
+    sessions = ep.SessionDriver.generate_sessions(50, seed=1)
+    latencies, failed = ep.SessionDriver.run(sessions)
+    assert failed == 0
+    assert len(latencies["General Menu:1"]) == 50
+    assert capsys.readouterr().out == ""  # The sessions' output went to their transports
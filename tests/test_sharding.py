@@ -0,0 +1,71 @@
+import json
+import os
+
+import pytest
+
+import E_Platform_9 as ep
+
+
+@pytest.fixture
+def sharded(platform):
+    """The test platform with its store migrated to per-course shards."""
+    ep.ShardStore.migrate()
+    return platform
+
+
+def assignments_on_disk(store):
+    with ep.Platform("reader", store).activate():
+        ep.load_all_data()
+        return {assignment._assignment_id: assignment._course._course_id
+                for assignment in ep.AssignmentManager._assignments}
+
+
+def test_records_for_a_course_that_was_not_loaded_are_saved(sharded, store):
+    with ep.Platform("first", store).activate():
+        ep.load_all_data()
+        ep.AssignmentManager.add_assignment("CRS-5ca834", "ASS-OLD", "12/01/2024", "Existing", 10.0)
+        ep.save_all_data()
+
+    ep.load_all_data(course_ids=["CRS-859a31"])
+    ep.AssignmentManager.add_assignment("CRS-5ca834", "ASS-NEW", "12/01/2024", "Created", 10.0)
+    ep.save_all_data()
+
+    on_disk = assignments_on_disk(store)
+    assert on_disk["ASS-NEW"] == "CRS-5ca834"
+    assert on_disk["ASS-OLD"] == "CRS-5ca834"  # Merged into the shard, not replaced
+    assert on_disk["ASS-001"] == "CRS-859a31"
+
+
+def test_partial_load_leaves_other_courses_alone(sharded, store):
+    ep.load_all_data(course_ids=["CRS-859a31"])
+    assert {enrollment._course._course_id for enrollment in ep.EnrollmentManager._enrollments} == {"CRS-859a31"}
+    ep.AssignmentManager.add_assignment("CRS-859a31", "ASS-NEW", "12/01/2024", "Created", 10.0)
+    ep.save_all_data()
+    assert set(assignments_on_disk(store)) == {"ASS-001", "ASS-002", "ASS-NEW"}
+
+
+def test_course_ids_are_rejected_without_sharded_storage(platform):
+    assert ep.load_all_data(course_ids=["CRS-859a31"]) is False
+    assert len(ep.UserManager._users) == 0
+    assert ep.load_all_data() is True
+
+
+def manifest_on_disk(store):
+    with open(os.path.join(store, ep.ShardStore.SHARD_FOLDER, ep.ShardStore.MANIFEST)) as file:
+        return json.load(file)
+
+
+def test_shards_are_removed_only_after_a_complete_parallel_save(sharded, store):
+    ep.load_all_data()
+    student = ep.GradeManager._grades[0]._student
+    ep.GradeManager.discard_grades(set(ep.GradeManager._grades))  # Empties the CRS-859a31 grades shard
+    ep.GradeManager.assign_grade(student, ep.CourseManager.get_course_by_id("CRS-5ca834"), 2.0)
+    old_shard = os.path.join(store, ep.ShardStore.shard_path("grades", "CRS-859a31"))
+    manifest = manifest_on_disk(store)
+
+    assert ep.save_all_data(parallel=True, deadline=0) == []
+    assert os.path.exists(old_shard) and manifest_on_disk(store) == manifest
+
+    ep.save_all_data(parallel=True)
+    assert not os.path.exists(old_shard)
+    assert manifest_on_disk(store)["grades"] == {"CRS-5ca834": 1}
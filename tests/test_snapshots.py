@@ -0,0 +1,43 @@
+import E_Platform_9 as ep
+
+
+def test_snapshot_reads_records_as_pinned(loaded):
+    course = ep.CourseManager.get_course_by_id("CRS-859a31")
+    student = course._enrolled_students[0]
+    with ep.VersionStore.reading() as snapshot:
+        course._capacity = 99
+        ep.CourseManager.drop_student(course, student)
+        assert course._capacity == 99 and student not in course._enrolled_students
+        pinned = snapshot.view(course)
+        assert pinned._capacity != 99 and student in pinned._enrolled_students
+
+
+def test_snapshot_reads_collections_as_pinned(loaded):
+    course = ep.CourseManager.get_course_by_id("CRS-859a31")
+    with ep.VersionStore.reading() as snapshot:
+        ep.GradeManager.assign_grade(course._enrolled_students[0], course, 2.0)
+        ep.CourseManager.remove_course("CRS-4912d2")
+        assert len(snapshot.collection("grades")) == 16
+        assert "CRS-4912d2" in [course._course_id for course in snapshot.collection("courses")]
+    assert len(ep.GradeManager._grades) == 17
+
+
+def test_each_snapshot_sees_its_own_version(loaded):
+    course = ep.CourseManager.get_course_by_id("CRS-859a31")
+    first = ep.VersionStore.pin()
+    course._capacity = 50
+    second = ep.VersionStore.pin()
+    course._capacity = 60
+    assert first.view(course)._capacity not in (50, 60)
+    assert second.view(course)._capacity == 50
+    first.release()
+    assert second.view(course)._capacity == 50
+    second.release()
+    assert ep.VersionStore._readers == {} and ep.VersionStore._history == {}
+
+
+def test_writes_without_open_snapshots_keep_no_copies(loaded):
+    course = ep.CourseManager.get_course_by_id("CRS-859a31")
+    course._capacity = 70
+    ep.GradeManager.assign_grade(course._enrolled_students[0], course, 2.0)
+    assert ep.VersionStore._history == {} and ep.VersionStore._held == {}
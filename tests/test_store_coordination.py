@@ -0,0 +1,59 @@
+import json
+import multiprocessing
+import os
+
+import pytest
+
+import E_Platform_9 as ep
+
+needs_fork = pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(),
+                                reason="the other session runs in a forked process")
+
+
+def rename_user(save_folder, user_id, first_name):
+    """Another session: load the store, rename one user and save."""
+    with ep.Platform("other", save_folder).activate():
+        ep.load_all_data()
+        ep.UserManager.find_user_by_id(user_id)._first_name = first_name
+        ep.UserManager.save_users()
+
+
+def in_other_process(function, *args):
+    process = multiprocessing.get_context("fork").Process(target=function, args=args)
+    process.start()
+    process.join()
+    assert process.exitcode == 0
+
+
+def saved_users(store):
+    with open(os.path.join(store, "users.json")) as file:
+        return {record["id"]: record for record in json.load(file)}
+
+
+@needs_fork
+@pytest.mark.parametrize("parallel", [False, True])
+def test_merging_keeps_other_sessions_edits(platform, store, parallel):
+    ep.load_all_data(parallel=parallel, max_workers=2)
+    in_other_process(rename_user, store, "STU-24-181694", "Renamed elsewhere")
+
+    ep.UserManager.find_user_by_id("STU-24-339058")._first_name = "Renamed here"
+    ep.UserManager.save_users()
+
+    users = saved_users(store)
+    assert users["STU-24-181694"]["first_name"] == "Renamed elsewhere"
+    assert users["STU-24-339058"]["first_name"] == "Renamed here"
+
+
+def test_parallel_load_keeps_source_text(platform):
+    ep.load_all_data(parallel=True, max_workers=2)
+    assert all(user._fragment is not None for user in ep.UserManager._users)
+    assert not ep.DirtyTracker.is_dirty("users")
+
+
+def test_records_set_back_to_their_loaded_value_are_not_published(loaded):
+    user = ep.UserManager.find_user_by_id("STU-24-339058")
+    first_name = user._first_name
+    user._first_name = "Changed"
+    user._first_name = first_name
+    changed, deleted = ep.StoreCoordinator.pending("users", ep.UserManager._users)
+    assert changed == [] and deleted == set()
@@ -0,0 +1,105 @@
+import json
+import os
+import threading
+
+import pytest
+
+import E_Platform_9 as ep
+
+
+def temp_files(folder):
+    return [name for _, _, names in os.walk(folder) for name in names if name.endswith(".tmp")]
+
+
+def test_threads_writing_one_file_do_not_share_a_temp_file(tmp_path):
+    texts = [json.dumps([{"writer": writer}] * 200) for writer in range(8)]
+    errors = []
+
+    def write(text):
+        try:
+            for _ in range(20):
+                ep.write_text(str(tmp_path), "grades.json", text, ep.StoreCompression.PLAIN)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(text,)) for text in texts]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert (tmp_path / "grades.json").read_text() in texts
+    assert temp_files(tmp_path) == []
+
+
+@pytest.mark.parametrize("codec", sorted(ep.StoreCompression.CODECS))
+def test_compressed_writes_round_trip(tmp_path, codec):
+    records = [{"grade_id": f"GRD-{number}", "grade_value": 1.0} for number in range(50)]
+    ep.write_collection(str(tmp_path), "grades.json", records, compression=(codec, None))
+    assert ep.StoreCompression.detect(str(tmp_path / "grades.json")) == codec
+    with ep.StoreCompression.open_text(str(tmp_path / "grades.json")) as file:
+        assert json.load(file) == records
+
+
+def test_remove_temp_files_only_removes_the_tagged_save(tmp_path):
+    (tmp_path / ".grades.json.1234-abc.x1y2.tmp").write_text("partial")
+    (tmp_path / ".grades.json.1234-def.x1y2.tmp").write_text("another save in flight")
+    ep.remove_temp_files(str(tmp_path), "grades.json", "1234-abc")
+    assert temp_files(tmp_path) == [".grades.json.1234-def.x1y2.tmp"]
+
+
+def test_parallel_save_past_its_deadline_leaves_no_temp_files(loaded, store):
+    for grade in ep.GradeManager._grades:
+        grade._grade_value = 2.0
+    for user in ep.UserManager._users:
+        ep.DirtyTracker.mark(user)
+    ep.save_all_data(parallel=True, deadline=0)
+    assert temp_files(store) == []
+
+
+DAMAGED = {
+    "gzip": b"\x1f\x8b" + b"not really gzip",
+    "bz2": b"BZh9" + b"not really bz2",
+    "lzma": b"\xfd7zXZ\x00" + b"not really xz",
+}
+
+
+def damaged_files():
+    cases = [(codec, data) for codec, data in DAMAGED.items() if codec in ep.StoreCompression.CODECS]
+    whole = ep.StoreCompression.CODECS["gzip"].compress(json.dumps([{"grade_id": "GRD-1"}] * 100).encode())
+    cases.append(("truncated gzip", whole[:len(whole) // 2]))
+    return cases
+
+
+@pytest.mark.parametrize("case, data", damaged_files())
+def test_damaged_files_are_reported_not_raised(platform, store, capsys, case, data):
+    with open(os.path.join(store, "grades.json"), "wb") as file:
+        file.write(data)
+    with open(os.path.join(store, ep.StoreCoordinator.VERSIONS_FILE), "wb") as file:
+        file.write(data)
+    assert ep.load_json("grades.json") == []
+    assert ep.parse_collection(store, "grades.json") == ([], [])
+    assert ep.DirtyTracker.load("grades.json") == []
+    assert ep.StoreCoordinator.read_versions() == {}
+    assert "ERROR: Failed to read grades.json" in capsys.readouterr().out
+
+
+def test_compress_level_needs_a_codec(capsys):
+    with pytest.raises(SystemExit):
+        ep.parse_args(["--compress-level", "5"])
+    assert "--compress-level needs --compress" in capsys.readouterr().err
+    assert ep.parse_args(["--compress", "gzip", "--compress-level", "5"]).compress_level == 5
+
+
+def test_serial_save_lists_only_the_collections_it_wrote(loaded, monkeypatch):
+    ep.save_all_data()  # Writes back the records the loader repaired
+    ep.GradeManager._grades[0]._grade_value = 2.0
+    assert ep.save_all_data() == ["grades.json"]
+    assert ep.save_all_data() == []
+
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+    ep.GradeManager._grades[0]._grade_value = 3.0
+    monkeypatch.setattr(ep, "write_text", fail)
+    assert ep.save_all_data() == []
+    assert ep.DirtyTracker.is_dirty("grades")
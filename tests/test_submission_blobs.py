@@ -0,0 +1,45 @@
+import zlib
+from datetime import datetime, timedelta
+
+import pytest
+
+import E_Platform_1 as ep1
+
+
+@pytest.fixture
+def assignment(tmp_path):
+    store = ep1.BlobStore(str(tmp_path / "blobs"))
+    return ep1.Assignment("A1", "Essay", "", datetime.now() + timedelta(days=1), 10, blob_store=store)
+
+
+def test_submissions_keep_only_the_hash_in_memory(assignment):
+    assignment.submit_assignment("S1", "My essay about sorting algorithms.")
+    stored = assignment.get_all_submissions()["S1"]
+    assert "submission" not in stored and stored["size"] == 34
+    submission = assignment.get_submission("S1")
+    assert submission["submission"] == "My essay about sorting algorithms."
+    assert "submission" not in assignment.get_all_submissions()["S1"]
+
+
+def test_identical_bodies_share_one_blob(assignment, tmp_path):
+    assignment.submit_assignment("S1", "Same answer")
+    assignment.submit_assignment("S2", "Same answer")
+    hashes = {submission["submission_hash"] for submission in assignment.get_all_submissions().values()}
+    assert len(hashes) == 1
+    assert len([path for path in (tmp_path / "blobs").rglob("*") if path.is_file()]) == 1
+
+
+def test_damaged_blobs_are_detected(assignment):
+    assignment.submit_assignment("S1", "Original answer")
+    digest = assignment.get_all_submissions()["S1"]["submission_hash"]
+    with open(assignment.blob_store._path(digest), "wb") as file:
+        file.write(zlib.compress(b"Tampered answer"))
+    with pytest.raises(ValueError, match="corrupted"):
+        assignment.get_submission("S1")
+
+
+def test_missing_blobs_are_reported(tmp_path):
+    store = ep1.BlobStore(str(tmp_path / "blobs"))
+    with pytest.raises(ValueError, match="not found"):
+        store.get("0" * 64)
+    assert not store.contains("0" * 64)
@@ -0,0 +1,65 @@
+import os
+import shutil
+import threading
+
+import E_Platform_9 as ep
+from conftest import SAMPLE_STORE
+
+
+def host_with_tenants(tmp_path, *names):
+    for name in names:
+        shutil.copytree(SAMPLE_STORE, os.path.join(tmp_path, name))
+    return ep.PlatformHost(str(tmp_path))
+
+
+def count_grades():
+    with ep.VersionStore.reading() as snapshot:
+        return len(snapshot.collection("grades"))
+
+
+def test_tenants_do_not_share_state(tmp_path):
+    host = host_with_tenants(tmp_path, "north", "south")
+    course = host.run("north", ep.CourseManager.get_course_by_id, "CRS-859a31")
+    host.run("north", ep.GradeManager.assign_grade, course._enrolled_students[0], course, 2.0)
+    assert host.read("north", count_grades) == 17
+    assert host.read("south", count_grades) == 16
+
+
+def test_snapshot_pinned_before_an_unload_can_be_released(tmp_path):
+    host = host_with_tenants(tmp_path, "north")
+    platform = host.tenant("north")
+    host.run("north", count_grades)
+    with platform.activate():
+        snapshot = ep.VersionStore.pin()
+    platform.unload()
+    snapshot.release()
+    assert host.read("north", count_grades) == 16
+    with platform.activate():
+        assert ep.VersionStore._readers == {}
+
+
+def test_reads_race_unloads(tmp_path):
+    host = host_with_tenants(tmp_path, "north")
+    host.run("north", count_grades)
+    platform = host.tenant("north")
+    stop = threading.Event()
+    results, errors = [], []
+
+    def read():
+        try:
+            while not stop.is_set():
+                results.append(host.read("north", count_grades))
+        except Exception as e:
+            errors.append(e)
+
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    for thread in readers:
+        thread.start()
+    for _ in range(20):
+        with platform.lock:
+            platform.unload()
+    stop.set()
+    for thread in readers:
+        thread.join()
+    assert errors == []
+    assert results and set(results) == {16}
@@ -0,0 +1,55 @@
+from types import SimpleNamespace
+
+import pytest
+
+import E_Platform_1 as ep1
+
+
+def course(course_id, sessions):
+    return ep1.Course(course_id, course_id, "", schedule=ep1.Schedule(course_id, "2024-08-16", "2024-12-16", sessions))
+
+
+def test_overlapping_sessions_conflict():
+    timetable = ep1.Timetable()
+    timetable.add_course(course("MATH", ["Monday 10:00-12:00"]))
+    assert timetable.find_conflicts(course("PHYS", ["Monday 11:00-13:00"]))
+    assert not timetable.find_conflicts(course("CHEM", ["Monday 12:00-13:00"]))
+
+
+def test_updating_a_schedule_refreshes_every_timetable():
+    math = course("MATH", ["Monday 10:00-12:00"])
+    timetables = [ep1.Timetable(), ep1.Timetable()]
+    for timetable in timetables:
+        timetable.add_course(math)
+    math.schedule.update_schedule(["Tuesday 10:00-12:00"])
+    for timetable in timetables:
+        assert not timetable.find_conflicts(course("PHYS", ["Monday 10:00-12:00"]))
+        assert timetable.find_conflicts(course("CHEM", ["Tuesday 11:00-11:30"])) == [math]
+
+
+def test_dropped_courses_are_not_refreshed():
+    math = course("MATH", ["Monday 10:00-12:00"])
+    timetable = ep1.Timetable()
+    timetable.add_course(math)
+    timetable.remove_course(math)
+    math.schedule.update_schedule(["Tuesday 10:00-12:00"])
+    assert len(timetable.tree) == 0
+
+
+def test_invalid_updates_change_nothing():
+    math = course("MATH", ["Monday 10:00-12:00"])
+    timetable = ep1.Timetable()
+    timetable.add_course(math)
+    with pytest.raises(ValueError):
+        math.schedule.update_schedule(["Tuesday 10:00-12:00", "Friday 24:00-24:30"])
+    assert math.schedule.sessions == ["Monday 10:00-12:00"]
+    assert timetable.find_conflicts(course("PHYS", ["Monday 11:00-13:00"]))
+
+
+def test_catalog_conflicts_list_the_earlier_course_first():
+    late = course("PHYS", ["Monday 11:00-13:00"])
+    early = course("MATH", ["Monday 10:00-12:00"])
+    student = SimpleNamespace(name="Ana")
+    for listed in (late, early):
+        listed.students_enrolled.append(student)
+    assert ep1.Timetable.validate_catalog([late, early]) == [(student, early, late)]
@@ -0,0 +1,38 @@
+import E_Platform_9 as ep
+
+UNENROLLED = "STU-24-277413"  # A sample student with no enrollments or grades
+
+
+def test_viewing_does_not_create_transcripts(loaded):
+    student = ep.UserManager.find_user_by_id(UNENROLLED)
+    course = ep.CourseManager.get_course_by_id("CRS-859a31")
+    ep.TranscriptManager.view_transcript(student)
+    ep.GradeManager.view_student_grades(student)
+    ep.RankingIndex.on_course_grade(student, course)
+    assert ep.TranscriptManager.find(student) is None
+    assert ep.TranscriptManager.current_grade(student, course) is None
+
+
+def test_publishing_reads_grades_without_creating_transcripts(loaded):
+    course = ep.CourseManager.get_course_by_id("CRS-859a31")
+    student = ep.UserManager.find_user_by_id("STU-24-339058")
+    assert ep.TranscriptManager.current_grade(student, course)._grade_value == 1.0
+    before = set(ep.TranscriptManager._transcripts)
+    ep.GradingPolicyManager.publish(course)
+    assert set(ep.TranscriptManager._transcripts) == before
+
+
+class Unscannable(ep.VersionedList):
+    def __iter__(self):
+        raise AssertionError("grades were scanned")
+
+
+def test_grading_a_course_reads_grades_from_transcripts(loaded):
+    course = ep.CourseManager.get_course_by_id("CRS-859a31")
+    ungraded = course._enrolled_students[0]
+    ep.GradeManager.discard_grades({grade for grade in ep.GradeManager._grades if grade._student is ungraded})
+    ep.GradeManager._grades = Unscannable(ep.GradeManager._grades)
+    console = ep.ScriptedTransport(["2.5"], {}, capture=True)
+    ep.GradeManager.grade_course(course._course_id, course._instructor, console=console)
+    assert ep.TranscriptManager.current_grade(ungraded, course)._grade_value == 2.5
+    assert "Not Yet Graded" in "".join(console.output)
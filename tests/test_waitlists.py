@@ -0,0 +1,83 @@
+import json
+import os
+
+import E_Platform_9 as ep
+
+
+def fill_course(course_id, waiting):
+    """Fills a course to capacity, then waitlists waiting more students; returns the waitlisted enrollments."""
+    course = ep.CourseManager.get_course_by_id(course_id)
+    course._capacity = len(course._enrolled_students)
+    enrollments = []
+    for number in range(waiting):
+        enrollments.append(request_seat(course, number))
+    return course, enrollments
+
+
+def request_seat(course, number, created_at=...):
+    """A new student's paid enrollment in course, approved; returns the enrollment."""
+    student = ep.Student("Waiting", str(number), 20, "Female", "01/01/2004", "Kidapawan City")
+    student.email, student.password = f"waiting{number}@platform.com", "secret"
+    ep.UserManager.add_user(student)
+    enrollment = ep.Enrollment(student, course, "Paid")
+    if created_at is not ...:
+        enrollment._created_at = created_at
+    ep.EnrollmentManager.add_enrollment(enrollment)
+    enrollment.approve()
+    return enrollment
+
+
+def test_dropping_a_student_promotes_the_first_in_line(loaded):
+    course, waiting = fill_course("CRS-859a31", 2)
+    leaving = course._enrolled_students[0]
+    ep.CourseManager.drop_student(course, leaving)
+    assert waiting[0]._enrollment_status == "Approved"
+    assert waiting[0]._student in course._enrolled_students
+    assert waiting[1]._enrollment_status == "Waitlisted"
+    assert ep.WaitlistManager.waitlist_length(course) == 1
+
+
+def test_untimed_enrollments_queue_behind_timed_ones(loaded):
+    course, _ = fill_course("CRS-859a31", 0)
+    untimed = request_seat(course, 0, created_at=None)  # As loaded from a file saved before enrollments were timed
+    timed = request_seat(course, 1)
+    ep.CourseManager.drop_student(course, course._enrolled_students[0])
+    assert timed._enrollment_status == "Approved"
+    assert untimed._enrollment_status == "Waitlisted"
+
+
+def test_seats_freed_on_disk_are_filled_on_load(loaded, store):
+    course, waiting = fill_course("CRS-859a31", 1)
+    ep.save_all_data()
+
+    path = os.path.join(store, "courses.json")
+    with open(path) as file:
+        courses = json.load(file)
+    for record in courses:
+        if record["course_id"] == "CRS-859a31":
+            record["capacity"] += 1  # Raised by another tool while the data was on disk
+    with open(path, "w") as file:
+        json.dump(courses, file, indent=4)
+
+    with ep.Platform("reloaded", store).activate():
+        ep.load_all_data()
+        enrollment = ep.EnrollmentManager.get_enrollment_by_id(waiting[0]._enrollment_id)
+        assert enrollment._enrollment_status == "Approved"
+        assert enrollment._student in enrollment._course._enrolled_students
+        assert ep.DirtyTracker.is_dirty("enrollments")  # The promotion is saved like any other change
+
+
+def test_removing_a_course_clears_its_waitlist_everywhere(loaded):
+    course, waiting = fill_course("CRS-859a31", 2)
+    student = waiting[0]._student
+    ep.CourseManager.remove_course("CRS-859a31")
+    assert all(enrollment._enrollment_status == "Cancelled" for enrollment in waiting)
+    assert student._id not in ep.WaitlistManager._waitlisted_by_student
+    assert ep.WaitlistManager._waitlisted_by_student == {}
+    assert ep.ReferenceIndex.check() == []
+
+
+def test_loading_indexes_every_reference(loaded):
+    assert ep.ReferenceIndex.check() == []
+    course = ep.CourseManager.get_course_by_id("CRS-859a31")
+    assert {student._id for student in course._enrolled_students} <= ep.ReferenceIndex._edges[course]